@@ -1,4 +1,4 @@
 """Gmail OAuth authentication module"""
-from .gmail_auth import authenticate_gmail
+from .gmail_auth import authenticate_gmail, get_credentials
 
-__all__ = ['authenticate_gmail']
+__all__ = ['authenticate_gmail', 'get_credentials']
@@ -11,12 +11,12 @@ TOKEN_FILE = 'token.pickle'
 CREDENTIALS_FILE = 'credentials.json'
 
 
-def authenticate_gmail():
+def get_credentials():
     """
-    Authenticate with Gmail using OAuth2.
+    Load, refresh or obtain OAuth2 credentials for Gmail.
 
     Returns:
-        gmail service object
+        google.oauth2.credentials.Credentials object
 
     Raises:
         FileNotFoundError: If credentials.json is not found
@@ -52,6 +52,20 @@ def authenticate_gmail():
         with open(TOKEN_FILE, 'wb') as token:
             pickle.dump(creds, token)
 
+    return creds
+
+
+def authenticate_gmail():
+    """
+    Authenticate with Gmail using OAuth2.
+
+    Returns:
+        gmail service object
+
+    Raises:
+        FileNotFoundError: If credentials.json is not found
+        Exception: If authentication fails
+    """
     # Build and return the Gmail service
-    service = build('gmail', 'v1', credentials=creds)
+    service = build('gmail', 'v1', credentials=get_credentials())
     return service
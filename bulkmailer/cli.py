@@ -1,13 +1,14 @@
 """CLI interface for bulkmailer"""
+import asyncio
 import sys
 import os
 import re
 import click
 import pandas as pd
-from .auth import authenticate_gmail
-from .file_loader import load_file
-from .template_engine import render_template
-from .sender import send_email
+from .auth import authenticate_gmail, get_credentials
+from .file_loader import load_file, load_lookup_table, read_key_column
+from .template_engine import compile_template, TemplateSyntaxError
+from .sender import send_email, load_attachments, AsyncGmailSender, EmailJob
 from .status_writer import save_file_with_status
 from .logging_utils import Logger
 
@@ -25,6 +26,12 @@ def validate_email(email: str) -> bool:
     return re.match(pattern, str(email)) is not None
 
 
+async def _send_concurrently(credentials, jobs, concurrency: int):
+    """Send rendered emails through the asyncio engine"""
+    async with AsyncGmailSender(credentials, max_concurrency=concurrency) as sender:
+        return await sender.send_many(jobs)
+
+
 @click.group()
 def cli():
     """Local Gmail Bulk Mailer CLI"""
@@ -39,10 +46,20 @@ def cli():
 @click.option('--inplace', is_flag=True, help='For Excel files, overwrite original instead of creating new file')
 @click.option('--limit', type=int, help='Limit number of emails to send (for testing)')
 @click.option('--dry-run', is_flag=True, help='Preview rendered emails without sending')
-def send(file, subject, body, log, inplace, limit, dry_run):
+@click.option('--attach', multiple=True, type=click.Path(exists=True), help='File to attach to every email (repeatable)')
+@click.option('--html-body', type=click.Path(exists=True), help='Optional HTML body template, sent with --body as the plain-text alternative')
+@click.option('--join', 'join_file', type=click.Path(exists=True), help='Optional CSV lookup table used to enrich each row')
+@click.option('--on', 'join_on', help='Column shared by --file and --join to look rows up by')
+@click.option('--concurrency', type=click.IntRange(min=1), default=1, help='Number of emails to send in parallel (default: 1)')
+def send(file, subject, body, log, inplace, limit, dry_run, attach, html_body, join_file, join_on, concurrency):
     """Send personalized bulk emails via Gmail"""
     logger = Logger(log)
 
+    if bool(join_file) != bool(join_on):
+        logger.log("Error: --join and --on must be used together")
+        logger.close()
+        sys.exit(EXIT_MISSING_FLAGS)
+
     try:
         # Load body template
         logger.log(f"Loading body template from {body}...")
@@ -53,6 +70,37 @@ def send(file, subject, body, log, inplace, limit, dry_run):
             logger.log(f"Error: Could not read body template: {e}")
             sys.exit(EXIT_FILE_ERROR)
 
+        html_body_template = None
+        if html_body:
+            logger.log(f"Loading HTML body template from {html_body}...")
+            try:
+                with open(html_body, 'r', encoding='utf-8') as f:
+                    html_body_template = f.read()
+            except Exception as e:
+                logger.log(f"Error: Could not read HTML body template: {e}")
+                sys.exit(EXIT_FILE_ERROR)
+
+        # Compile templates once for the whole campaign
+        try:
+            subject_compiled = compile_template(subject)
+            body_compiled = compile_template(body_template)
+            html_body_compiled = None
+            if html_body_template is not None:
+                html_body_compiled = compile_template(html_body_template, html=True)
+        except TemplateSyntaxError as e:
+            logger.log(f"Error: Invalid template: {e}")
+            sys.exit(EXIT_FILE_ERROR)
+
+        # Load attachments once for the whole campaign
+        attachments = []
+        if attach:
+            logger.log(f"Loading {len(attach)} attachment(s)...")
+            try:
+                attachments = load_attachments(list(attach))
+            except (FileNotFoundError, ValueError) as e:
+                logger.log(f"Error: {e}")
+                sys.exit(EXIT_FILE_ERROR)
+
         # Load data file
         logger.log(f"Loading data file from {file}...")
         try:
@@ -72,12 +120,37 @@ def send(file, subject, body, log, inplace, limit, dry_run):
         logger.log(f"Loaded {len(df)} rows from file")
         logger.log(f"Status column: {status_column}")
 
+        # Index the lookup table once, keeping only keys used by this file
+        lookup = None
+        if join_file:
+            if join_on not in df.columns:
+                logger.log(f"Error: Join column '{join_on}' not found in file")
+                sys.exit(EXIT_FILE_ERROR)
+            logger.log(f"Indexing lookup table {join_file} on '{join_on}'...")
+            try:
+                join_keys = read_key_column(file_data, join_on)
+                lookup = load_lookup_table(join_file, join_on, join_keys)
+            except (FileNotFoundError, ValueError) as e:
+                logger.log(f"Error: {e}")
+                sys.exit(EXIT_FILE_ERROR)
+            logger.log(f"Indexed {len(lookup.index)} matching lookup rows")
+            if not lookup.index and join_keys.notna().any():
+                logger.log(f"Warning: No '{join_on}' values in {file} matched {join_file}")
+
+            # Keep the original key text so saving the status doesn't
+            # rewrite IDs like 00123 as 123.0 and break the join on resume
+            df[join_on] = join_keys
+
         # Authenticate with Gmail (skip in dry-run)
         service = None
+        credentials = None
         if not dry_run:
             logger.log("Authenticating with Gmail...")
             try:
-                service = authenticate_gmail()
+                if concurrency > 1:
+                    credentials = get_credentials()
+                else:
+                    service = authenticate_gmail()
                 logger.log("Authentication successful")
             except FileNotFoundError as e:
                 logger.log(f"Error: {e}")
@@ -95,10 +168,12 @@ def send(file, subject, body, log, inplace, limit, dry_run):
         skipped_count = 0
         last_successful_row = -1
         rate_limited = False
+        # Rows queued for the asyncio engine when --concurrency > 1
+        pending = []
 
         for idx, row in df.iterrows():
             # Check limit
-            if limit and (sent_count + failed_count) >= limit:
+            if limit and (sent_count + failed_count + len(pending)) >= limit:
                 logger.log(f"\nReached limit of {limit} emails")
                 break
 
@@ -133,9 +208,11 @@ def send(file, subject, body, log, inplace, limit, dry_run):
 
             # Prepare row data for template rendering
             row_data = row.to_dict()
+            if lookup is not None:
+                row_data = lookup.enrich(row_data, join_keys[idx])
 
             # Render subject
-            rendered_subject, subject_success, subject_missing = render_template(subject, row_data)
+            rendered_subject, subject_success, subject_missing = subject_compiled.render(row_data)
             if not subject_success:
                 logger.log_failure(idx, email, f"Missing subject placeholders: {', '.join(subject_missing)}")
                 df.at[idx, status_column] = 'failed'
@@ -143,25 +220,47 @@ def send(file, subject, body, log, inplace, limit, dry_run):
                 continue
 
             # Render body
-            rendered_body, body_success, body_missing = render_template(body_template, row_data)
+            rendered_body, body_success, body_missing = body_compiled.render(row_data)
             if not body_success:
                 logger.log_failure(idx, email, f"Missing body placeholders: {', '.join(body_missing)}")
                 df.at[idx, status_column] = 'failed'
                 failed_count += 1
                 continue
 
+            # Render HTML body
+            rendered_html_body = None
+            if html_body_compiled is not None:
+                rendered_html_body, html_success, html_missing = html_body_compiled.render(row_data)
+                if not html_success:
+                    logger.log_failure(idx, email, f"Missing HTML body placeholders: {', '.join(html_missing)}")
+                    df.at[idx, status_column] = 'failed'
+                    failed_count += 1
+                    continue
+
             # Dry run mode - just print
             if dry_run:
                 logger.log(f"\n--- Row {idx} ---")
                 logger.log(f"To: {email}")
                 logger.log(f"Subject: {rendered_subject}")
                 logger.log(f"Body:\n{rendered_body}")
+                if rendered_html_body is not None:
+                    logger.log(f"HTML body:\n{rendered_html_body}")
+                if attachments:
+                    logger.log(f"Attachments: {', '.join(a.filename for a in attachments)}")
                 logger.log("-" * 50)
                 sent_count += 1
                 continue
 
+            # Queue email for concurrent sending
+            if concurrency > 1:
+                job = EmailJob(email, rendered_subject, rendered_body,
+                               attachments=attachments, html_body=rendered_html_body)
+                pending.append((idx, email, job))
+                continue
+
             # Send email
-            result = send_email(service, email, rendered_subject, rendered_body)
+            result = send_email(service, email, rendered_subject, rendered_body,
+                                attachments=attachments, html_body=rendered_html_body)
 
             if result.success:
                 logger.log_success(idx, email)
@@ -178,6 +277,29 @@ def send(file, subject, body, log, inplace, limit, dry_run):
                 df.at[idx, status_column] = 'failed'
                 failed_count += 1
 
+        if pending:
+            logger.log(f"\nSending {len(pending)} emails with up to {concurrency} in flight...")
+            results = asyncio.run(
+                _send_concurrently(credentials, [job for _, _, job in pending], concurrency)
+            )
+
+            for (idx, email, _), result in zip(pending, results):
+                if result is None:
+                    # Not attempted after a rate limit; left blank for resuming
+                    continue
+                if result.success:
+                    logger.log_success(idx, email)
+                    df.at[idx, status_column] = 'sent'
+                    sent_count += 1
+                    last_successful_row = idx
+                elif result.rate_limited:
+                    logger.log_failure(idx, email, result.error_message)
+                    rate_limited = True
+                else:
+                    logger.log_failure(idx, email, result.error_message)
+                    df.at[idx, status_column] = 'failed'
+                    failed_count += 1
+
         # Save file with status updates
         if not dry_run:
             logger.log("\nSaving file with status updates...")
@@ -1,4 +1,5 @@
 """File loading module for CSV and Excel files"""
 from .loader import load_file, FileData
+from .lookup import load_lookup_table, read_key_column, LookupTable
 
-__all__ = ['load_file', 'FileData']
+__all__ = ['load_file', 'FileData', 'load_lookup_table', 'read_key_column', 'LookupTable']
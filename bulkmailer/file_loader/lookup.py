@@ -0,0 +1,155 @@
+"""Lookup table for enriching recipient rows by key"""
+import csv
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+import pandas as pd
+from .loader import FileData
+
+
+@dataclass
+class LookupTable:
+    """Hash index from a key column to the other columns of a lookup file"""
+    file_path: str
+    key_column: str
+    columns: List[str]  # lookup columns, excluding the key
+    index: Dict[str, Dict[str, Optional[str]]]
+
+    def enrich(self, row_data: Dict[str, Any], key: Any) -> Dict[str, Any]:
+        """
+        Add lookup columns to a recipient row.
+
+        Non-null values already in the row are kept; blank cells in the row
+        are filled from the lookup. Rows without a match are returned
+        unchanged, so placeholders that depend on the lookup are reported
+        as missing when rendering.
+
+        Args:
+            row_data: Dictionary mapping column names to values
+            key: The row's key as text, as returned by read_key_column
+
+        Returns:
+            A new dictionary with the lookup columns merged in
+        """
+        match = self.index.get(normalize_key(key))
+        if match is None:
+            return row_data
+
+        enriched = dict(match)
+        for column, value in row_data.items():
+            if not _is_null(value) or column not in enriched:
+                enriched[column] = value
+        return enriched
+
+
+def _is_null(value: Any) -> bool:
+    """Check for None or NaN, the way render_template treats missing values"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def normalize_key(value: Any) -> Optional[str]:
+    """
+    Normalize a key value for lookup.
+
+    Keys are compared as text, exactly as written in each file, so
+    zero-padded IDs like 00123 only match 00123.
+
+    Args:
+        value: Key text from the recipient file or the lookup file
+
+    Returns:
+        The key as a stripped string, or None for missing values
+    """
+    if _is_null(value):
+        return None
+    key = str(value).strip()
+    return key or None
+
+
+def read_key_column(file_data: FileData, column: str) -> pd.Series:
+    """
+    Re-read the join column of a loaded file as text.
+
+    load_file lets pandas infer types, which turns IDs like 00123 into the
+    integer 123. Reading the column again with dtype=str keeps the original
+    text, so it compares equal to keys read from the lookup CSV.
+
+    Args:
+        file_data: FileData returned by load_file
+        column: Name of the join column
+
+    Returns:
+        Series of key strings (NaN for blanks), aligned with file_data.df
+    """
+    if file_data.file_type == 'csv':
+        keys = pd.read_csv(file_data.file_path, usecols=[column], dtype=str)[column]
+    else:
+        keys = pd.read_excel(file_data.file_path, usecols=[column], dtype=str, engine='openpyxl')[column]
+
+    # load_file drops empty rows without resetting the index
+    return keys.loc[file_data.df.index]
+
+
+def load_lookup_table(file_path: str, key_column: str,
+                      wanted_keys: Optional[Iterable[Any]] = None) -> LookupTable:
+    """
+    Build a hash index of a CSV lookup table in a single streaming pass.
+
+    The file is read row by row rather than loaded as a DataFrame. When
+    wanted_keys is given, only matching rows are kept, so memory is bounded
+    by the recipient list even if the lookup table is much larger. If a key
+    appears more than once, the first row wins.
+
+    Args:
+        file_path: Path to the CSV lookup table
+        key_column: Column to join on
+        wanted_keys: Optional key text from the recipient file, see read_key_column
+
+    Returns:
+        LookupTable indexed by the key column
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is unsupported or the key column is missing
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Lookup file not found: {file_path}")
+
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext != '.csv':
+        raise ValueError(f"Unsupported lookup file format: {file_ext}. Only CSV is supported.")
+
+    wanted = None
+    if wanted_keys is not None:
+        wanted = {normalize_key(k) for k in wanted_keys} - {None}
+
+    index: Dict[str, Dict[str, Optional[str]]] = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or key_column not in reader.fieldnames:
+                raise ValueError(f"Join column '{key_column}' not found in lookup file")
+            columns = [c for c in reader.fieldnames if c != key_column]
+
+            for record in reader:
+                key = normalize_key(record.get(key_column))
+                if key is None or key in index:
+                    continue
+                if wanted is not None and key not in wanted:
+                    continue
+                # Blank cells count as missing, as pandas would read them
+                index[key] = {c: (record.get(c) or None) for c in columns}
+                if wanted is not None and len(index) == len(wanted):
+                    break
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error reading lookup file: {str(e)}")
+
+    return LookupTable(
+        file_path=file_path,
+        key_column=key_column,
+        columns=columns,
+        index=index
+    )
@@ -1,4 +1,13 @@
 """Gmail sender module"""
 from .gmail_sender import send_email, SendResult
+from .attachments import load_attachments, Attachment
+from .async_sender import AsyncGmailSender, EmailJob
 
-__all__ = ['send_email', 'SendResult']
+__all__ = [
+    'send_email',
+    'SendResult',
+    'load_attachments',
+    'Attachment',
+    'AsyncGmailSender',
+    'EmailJob',
+]
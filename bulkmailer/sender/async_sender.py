@@ -0,0 +1,225 @@
+"""Asyncio Gmail sender posting to the REST endpoint over a pooled HTTP client"""
+import asyncio
+import base64
+from dataclasses import dataclass
+from typing import List, Optional
+import httpx
+from google.auth.transport.requests import Request
+from .attachments import Attachment
+from .gmail_sender import (
+    SendResult,
+    TRANSIENT_STATUS_CODES,
+    build_message_bytes,
+    classify_http_error,
+    inline_raw_payload,
+)
+
+GMAIL_API_URL = 'https://gmail.googleapis.com'
+SEND_PATH = '/gmail/v1/users/me/messages/send'
+UPLOAD_PATH = '/upload/gmail/v1/users/me/messages/send'
+
+
+@dataclass
+class EmailJob:
+    """A rendered email waiting to be sent"""
+    to: str
+    subject: str
+    body: str
+    attachments: Optional[List[Attachment]] = None
+    html_body: Optional[str] = None
+
+
+def _describe_error(response: httpx.Response):
+    """
+    Extract error details and a description from a Gmail error response.
+
+    Args:
+        response: The failed HTTP response
+
+    Returns:
+        Tuple of (error_details, description)
+    """
+    try:
+        data = response.json()
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or not isinstance(data.get('error'), dict):
+        return [], response.text or response.reason_phrase
+
+    error = data['error']
+
+    # Same precedence googleapiclient uses to fill HttpError.error_details
+    error_details = []
+    for keyword in ['details', 'errors']:
+        if keyword in error:
+            error_details = error[keyword]
+            break
+    return error_details, error.get('message', response.reason_phrase)
+
+
+class AsyncGmailSender:
+    """
+    Send many emails concurrently from a single asyncio event loop.
+
+    Use as an async context manager so the pooled HTTP client is closed:
+
+        async with AsyncGmailSender(get_credentials()) as sender:
+            results = await sender.send_many(jobs)
+    """
+
+    def __init__(self, credentials, max_concurrency: int = 100, max_retries: int = 3,
+                 base_url: str = GMAIL_API_URL, http2: bool = True):
+        """
+        Initialize the sender.
+
+        Args:
+            credentials: OAuth2 credentials, as returned by get_credentials
+            max_concurrency: Maximum number of requests in flight
+            max_retries: Maximum number of retry attempts for transient errors
+            base_url: Gmail API root, overridable for testing against a local server
+            http2: If True, negotiate HTTP/2 so requests share connections
+        """
+        self.credentials = credentials
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_url = base_url
+        self.http2 = http2
+        self.client = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._auth_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            timeout=httpx.Timeout(60.0)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+
+    async def _authorization(self) -> str:
+        """Return the Authorization header, refreshing the token at most once at a time"""
+        async with self._auth_lock:
+            if not self.credentials.valid:
+                await asyncio.to_thread(self.credentials.refresh, Request())
+        return f"Bearer {self.credentials.token}"
+
+    async def _post(self, message_bytes: bytes, raw: Optional[str]) -> httpx.Response:
+        """
+        Post a message inline, or through a resumable upload session.
+
+        Args:
+            message_bytes: The serialized message
+            raw: Inline payload from inline_raw_payload, or None for resumable upload
+
+        Returns:
+            The final HTTP response
+        """
+        headers = {'Authorization': await self._authorization()}
+        if raw is not None:
+            return await self.client.post(SEND_PATH, headers=headers, json={'raw': raw})
+
+        # Start the session, then upload the message to the returned Location
+        session = await self.client.post(
+            UPLOAD_PATH,
+            params={'uploadType': 'resumable'},
+            headers={
+                **headers,
+                'X-Upload-Content-Type': 'message/rfc822',
+                'X-Upload-Content-Length': str(len(message_bytes)),
+            },
+            json={}
+        )
+        if not session.is_success or 'Location' not in session.headers:
+            return session
+
+        return await self.client.put(
+            session.headers['Location'],
+            headers={**headers, 'Content-Type': 'message/rfc822'},
+            content=message_bytes
+        )
+
+    async def send(self, job: EmailJob) -> SendResult:
+        """
+        Send one email with retry logic, within the concurrency limit.
+
+        Args:
+            job: The rendered email
+
+        Returns:
+            SendResult indicating success/failure and any error details
+        """
+        async with self._semaphore:
+            return await self._send(job)
+
+    async def _send(self, job: EmailJob) -> SendResult:
+        """Send one email with retry logic; the caller holds a semaphore slot"""
+        message_bytes = build_message_bytes(
+            job.to, job.subject, job.body, job.attachments, job.html_body
+        )
+        raw = inline_raw_payload(message_bytes, bool(job.attachments))
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._post(message_bytes, raw)
+            except Exception as e:
+                # Unexpected error
+                return SendResult(
+                    success=False,
+                    error_message=f"Unexpected error: {str(e)}",
+                    rate_limited=False
+                )
+
+            if response.is_success:
+                return SendResult(success=True)
+
+            status_code = response.status_code
+
+            # Check for transient errors (500, 503)
+            if status_code in TRANSIENT_STATUS_CODES and attempt < self.max_retries - 1:
+                # Wait before retrying (exponential backoff)
+                await asyncio.sleep(2 ** attempt)
+                continue
+
+            error_details, description = _describe_error(response)
+            return classify_http_error(status_code, error_details, description)
+
+        # If we exhausted all retries
+        return SendResult(
+            success=False,
+            error_message=f"Failed after {self.max_retries} attempts",
+            rate_limited=False
+        )
+
+    async def send_many(self, jobs: List[EmailJob]) -> List[Optional[SendResult]]:
+        """
+        Send emails concurrently, stopping once a rate limit is hit.
+
+        Requests already in flight when a rate limit is reported are allowed
+        to finish; jobs that have not started yet are not attempted.
+
+        Args:
+            jobs: Rendered emails to send
+
+        Returns:
+            One entry per job, in order: a SendResult, or None if not attempted
+        """
+        rate_limited = asyncio.Event()
+
+        async def run(job: EmailJob) -> Optional[SendResult]:
+            async with self._semaphore:
+                if rate_limited.is_set():
+                    return None
+                result = await self._send(job)
+            if result.rate_limited:
+                rate_limited.set()
+            return result
+
+        return await asyncio.gather(*(run(job) for job in jobs))
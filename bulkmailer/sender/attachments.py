@@ -0,0 +1,68 @@
+"""Shared attachments that are encoded once per campaign"""
+import mimetypes
+import os
+from dataclasses import dataclass
+from email import encoders
+from email.mime.base import MIMEBase
+from typing import List
+
+
+@dataclass
+class Attachment:
+    """A file attachment serialized as a ready-to-splice MIME part"""
+    filename: str
+    size: int  # size of the original file in bytes
+    part_bytes: bytes  # headers plus base64 body, without boundary lines
+
+
+def load_attachment(file_path: str) -> Attachment:
+    """
+    Read, base64-encode and wrap a file as a MIME part.
+
+    The result is meant to be built once per campaign and spliced into
+    every message, so the file is never re-read or re-encoded per recipient.
+
+    Args:
+        file_path: Path to the file to attach
+
+    Returns:
+        Attachment holding the serialized MIME part
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file cannot be read
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Attachment not found: {file_path}")
+
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except Exception as e:
+        raise ValueError(f"Error reading attachment {file_path}: {str(e)}")
+
+    content_type, encoding = mimetypes.guess_type(file_path)
+    if content_type is None or encoding is not None:
+        content_type = 'application/octet-stream'
+    maintype, subtype = content_type.split('/', 1)
+
+    filename = os.path.basename(file_path)
+    part = MIMEBase(maintype, subtype)
+    part.set_payload(data)
+    encoders.encode_base64(part)
+    part.add_header('Content-Disposition', 'attachment', filename=filename)
+
+    return Attachment(filename=filename, size=len(data), part_bytes=part.as_bytes())
+
+
+def load_attachments(file_paths: List[str]) -> List[Attachment]:
+    """
+    Load several attachments, once each.
+
+    Args:
+        file_paths: Paths of the files to attach
+
+    Returns:
+        List of Attachment objects in the given order
+    """
+    return [load_attachment(path) for path in file_paths]
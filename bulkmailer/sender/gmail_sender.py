@@ -1,10 +1,22 @@
 """Gmail sender with retry logic and rate limit detection"""
 import base64
+import io
 import time
+import uuid
+from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
+from .attachments import Attachment
+
+RATE_LIMIT_REASONS = ['userRateLimitExceeded', 'rateLimitExceeded', 'quotaExceeded']
+TRANSIENT_STATUS_CODES = [500, 503]
+
+# Inline base64url 'raw' payloads larger than this are sent through the
+# resumable media upload endpoint instead
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
 
 
 @dataclass
@@ -15,26 +27,173 @@ class SendResult:
     rate_limited: bool = False
 
 
-def create_message(to: str, subject: str, body: str) -> dict:
+def classify_http_error(status_code: int, error_details, description: str) -> SendResult:
     """
-    Create a message for an email.
+    Turn a failed Gmail API response into a SendResult.
+
+    Args:
+        status_code: HTTP status code of the response
+        error_details: Error details reported by the API, if any
+        description: Human-readable description of the error
+
+    Returns:
+        SendResult flagging rate limits, or a plain failure
+    """
+    # Check for rate limiting (429 or 403 with specific reason)
+    if status_code == 429:
+        return SendResult(
+            success=False,
+            error_message=f"Rate limit exceeded: {description}",
+            rate_limited=True
+        )
+
+    # Check for quota exceeded (403 with userRateLimitExceeded)
+    if status_code == 403 and isinstance(error_details, list):
+        for detail in error_details:
+            if isinstance(detail, dict) and detail.get('reason') in RATE_LIMIT_REASONS:
+                return SendResult(
+                    success=False,
+                    error_message=f"Gmail rate limit: {description}",
+                    rate_limited=True
+                )
+
+    # Other errors - don't retry
+    return SendResult(
+        success=False,
+        error_message=f"HTTP Error {status_code}: {description}",
+        rate_limited=False
+    )
+
+
+def _create_body_part(body: str, html_body: Optional[str] = None):
+    """
+    Create the body part of an email.
+
+    Args:
+        body: The plain-text body
+        html_body: Optional HTML body, sent as an alternative to the text
+
+    Returns:
+        A text/plain part, or a multipart/alternative part with text and HTML
+    """
+    if html_body is None:
+        return MIMEText(body)
+
+    part = MIMEMultipart('alternative')
+    part.attach(MIMEText(body, 'plain'))
+    part.attach(MIMEText(html_body, 'html'))
+    return part
+
+
+def build_message_bytes(to: str, subject: str, body: str,
+                        attachments: Optional[List[Attachment]] = None,
+                        html_body: Optional[str] = None) -> bytes:
+    """
+    Build the RFC 822 bytes for an email.
+
+    Without attachments the body part is the whole message. With attachments
+    a multipart/mixed message is built around the body, and the pre-encoded
+    attachment parts are spliced in as cached bytes.
 
     Args:
         to: Email address of the receiver
         subject: The subject of the email
         body: The body text of the email
+        attachments: Optional list of pre-encoded attachments
+        html_body: Optional HTML alternative to the body text
 
     Returns:
-        An object containing a base64url encoded email
+        The serialized message
     """
-    message = MIMEText(body)
+    if not attachments:
+        message = _create_body_part(body, html_body)
+        message['to'] = to
+        message['subject'] = subject
+        return message.as_bytes()
+
+    boundary = f"==============={uuid.uuid4().hex}=="
+    message = MIMEMultipart('mixed', boundary=boundary)
     message['to'] = to
     message['subject'] = subject
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    message.attach(_create_body_part(body, html_body))
+
+    # Splice the cached parts in front of the closing delimiter
+    close_delimiter = f"--{boundary}--".encode()
+    head, _, tail = message.as_bytes().rpartition(close_delimiter)
+    delimiter = f"--{boundary}\n".encode()
+    parts = b''.join(delimiter + a.part_bytes + b'\n' for a in attachments)
+    return head + parts + close_delimiter + tail
+
+
+def create_message(to: str, subject: str, body: str,
+                   attachments: Optional[List[Attachment]] = None,
+                   html_body: Optional[str] = None) -> dict:
+    """
+    Create a message for an email.
+
+    Args:
+        to: Email address of the receiver
+        subject: The subject of the email
+        body: The body text of the email
+        attachments: Optional list of pre-encoded attachments
+        html_body: Optional HTML alternative to the body text
+
+    Returns:
+        An object containing a base64url encoded email
+    """
+    message_bytes = build_message_bytes(to, subject, body, attachments, html_body)
+    raw = base64.urlsafe_b64encode(message_bytes).decode()
     return {'raw': raw}
 
 
-def send_email(service, to: str, subject: str, body: str, max_retries: int = 3) -> SendResult:
+def inline_raw_payload(message_bytes: bytes, has_attachments: bool) -> Optional[str]:
+    """
+    Encode a message for the inline 'raw' send path, if it should use it.
+
+    Messages with attachments always go through media upload, so the cached
+    attachment parts are sent as is instead of being base64-encoded again.
+    Other messages are sent inline unless the encoded payload, which is about
+    4/3 of the message size, exceeds SIMPLE_UPLOAD_LIMIT.
+
+    Args:
+        message_bytes: The serialized message
+        has_attachments: Whether the message carries attachments
+
+    Returns:
+        The base64url encoded message, or None to use media upload
+    """
+    if has_attachments:
+        return None
+
+    raw = base64.urlsafe_b64encode(message_bytes).decode()
+    if len(raw) > SIMPLE_UPLOAD_LIMIT:
+        return None
+    return raw
+
+
+def _build_send_request(service, message_bytes: bytes, raw: Optional[str]):
+    """
+    Build a Gmail send request.
+
+    Args:
+        service: Authenticated Gmail API service object
+        message_bytes: The serialized message
+        raw: Inline payload from inline_raw_payload, or None for media upload
+
+    Returns:
+        An executable Gmail API request
+    """
+    messages = service.users().messages()
+    if raw is None:
+        media = MediaIoBaseUpload(io.BytesIO(message_bytes), mimetype='message/rfc822', resumable=True)
+        return messages.send(userId='me', body={}, media_body=media)
+
+    return messages.send(userId='me', body={'raw': raw})
+
+
+def send_email(service, to: str, subject: str, body: str, max_retries: int = 3,
+               attachments: Optional[List[Attachment]] = None,
+               html_body: Optional[str] = None) -> SendResult:
     """
     Send an email via Gmail API with retry logic.
 
@@ -44,52 +203,32 @@ def send_email(service, to: str, subject: str, body: str, max_retries: int = 3)
         subject: Email subject
         body: Email body
         max_retries: Maximum number of retry attempts for transient errors
+        attachments: Optional list of pre-encoded attachments shared by the campaign
+        html_body: Optional HTML alternative to the body text
 
     Returns:
         SendResult indicating success/failure and any error details
     """
-    message = create_message(to, subject, body)
+    message_bytes = build_message_bytes(to, subject, body, attachments, html_body)
+    raw = inline_raw_payload(message_bytes, bool(attachments))
 
     for attempt in range(max_retries):
         try:
-            service.users().messages().send(userId='me', body=message).execute()
+            _build_send_request(service, message_bytes, raw).execute()
             return SendResult(success=True)
 
         except HttpError as e:
             error_details = e.error_details if hasattr(e, 'error_details') else []
             status_code = e.resp.status
 
-            # Check for rate limiting (429 or 403 with specific reason)
-            if status_code == 429:
-                return SendResult(
-                    success=False,
-                    error_message=f"Rate limit exceeded: {str(e)}",
-                    rate_limited=True
-                )
-
-            # Check for quota exceeded (403 with userRateLimitExceeded)
-            if status_code == 403:
-                for detail in error_details:
-                    if detail.get('reason') in ['userRateLimitExceeded', 'rateLimitExceeded', 'quotaExceeded']:
-                        return SendResult(
-                            success=False,
-                            error_message=f"Gmail rate limit: {str(e)}",
-                            rate_limited=True
-                        )
-
             # Check for transient errors (500, 503)
-            if status_code in [500, 503] and attempt < max_retries - 1:
+            if status_code in TRANSIENT_STATUS_CODES and attempt < max_retries - 1:
                 # Wait before retrying (exponential backoff)
                 wait_time = 2 ** attempt
                 time.sleep(wait_time)
                 continue
 
-            # Other errors - don't retry
-            return SendResult(
-                success=False,
-                error_message=f"HTTP Error {status_code}: {str(e)}",
-                rate_limited=False
-            )
+            return classify_http_error(status_code, error_details, str(e))
 
         except Exception as e:
             # Unexpected error
@@ -1,4 +1,11 @@
 """Template engine for placeholder replacement"""
 from .engine import render_template, validate_placeholders
+from .compiler import compile_template, CompiledTemplate, TemplateSyntaxError
 
-__all__ = ['render_template', 'validate_placeholders']
+__all__ = [
+    'render_template',
+    'validate_placeholders',
+    'compile_template',
+    'CompiledTemplate',
+    'TemplateSyntaxError',
+]
@@ -0,0 +1,194 @@
+"""Template compiler for conditional sections, filters and HTML bodies"""
+import math
+import re
+from dataclasses import dataclass, field
+from html import escape as html_escape
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class TemplateSyntaxError(ValueError):
+    """Raised when a template cannot be parsed"""
+
+
+# {field}, {field|filter|filter:arg}, {#if field}, {#else}, {/if}
+TAG_PATTERN = re.compile(r'\{(#if\s+\w+|#else|/if|\w+(?:\|[^{}]*)?)\}')
+
+FILTERS: Dict[str, Callable[[str], str]] = {
+    'title': str.title,
+    'upper': str.upper,
+    'lower': str.lower,
+    'strip': str.strip,
+}
+
+# A compiled node appends its output to `out` and any missing keys to `missing`
+Node = Callable[[Dict[str, Any], List[str], List[str]], None]
+
+
+def _is_missing(row_data: Dict[str, Any], key: str) -> bool:
+    """Check whether a key is absent or null, the same way render_template does"""
+    if key not in row_data:
+        return True
+    value = row_data[key]
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _is_present(row_data: Dict[str, Any], key: str) -> bool:
+    """Check whether a key has a non-empty value, for conditional sections"""
+    return not _is_missing(row_data, key) and str(row_data[key]).strip() != ''
+
+
+@dataclass
+class CompiledTemplate:
+    """A template parsed once into a render function"""
+    source: str
+    html: bool
+    placeholders: List[str]
+    required: List[str]  # placeholders without a default
+    conditions: List[str]  # fields tested by {#if} sections; optional
+    _nodes: List[Node] = field(repr=False)
+
+    def render(self, row_data: Dict[str, Any]) -> Tuple[str, bool, List[str]]:
+        """
+        Render the template with values from row_data.
+
+        Args:
+            row_data: Dictionary mapping column names to values
+
+        Returns:
+            Tuple of (rendered_string, success, missing_keys), as render_template.
+            Placeholders inside sections that are not rendered are never missing.
+        """
+        out: List[str] = []
+        missing: List[str] = []
+        for node in self._nodes:
+            node(row_data, out, missing)
+        return ''.join(out), len(missing) == 0, missing
+
+
+def _compile_text(text: str) -> Node:
+    """Compile a literal text run"""
+    def node(row_data, out, missing):
+        out.append(text)
+    return node
+
+
+def _compile_field(expression: str, escape: bool) -> Tuple[str, bool, Node]:
+    """
+    Compile a {field|filter...} tag.
+
+    Escaping is decided here, at compile time: HTML templates escape field
+    values unless the `raw` filter is used, while literal text is left as is.
+    """
+    name, *filter_specs = [part.strip() for part in expression.split('|')]
+    default: Optional[str] = None
+    transforms: List[Callable[[str], str]] = []
+
+    for spec in filter_specs:
+        filter_name, has_arg, arg = spec.partition(':')
+        if filter_name == 'default' and has_arg:
+            default = arg
+        elif filter_name == 'raw' and not has_arg:
+            escape = False
+        elif filter_name in FILTERS and not has_arg:
+            transforms.append(FILTERS[filter_name])
+        else:
+            raise TemplateSyntaxError(f"Unknown filter '{spec}' in {{{expression}}}")
+
+    if escape:
+        transforms.append(html_escape)
+
+    def node(row_data, out, missing):
+        if _is_missing(row_data, name):
+            if default is None:
+                missing.append(name)
+                return
+            value = default
+        else:
+            value = str(row_data[name])
+        for transform in transforms:
+            value = transform(value)
+        out.append(value)
+
+    return name, default is None, node
+
+
+def _compile_section(condition: str, body: List[Node], orelse: List[Node]) -> Node:
+    """Compile an {#if field}...{#else}...{/if} section"""
+    def node(row_data, out, missing):
+        for child in (body if _is_present(row_data, condition) else orelse):
+            child(row_data, out, missing)
+    return node
+
+
+def compile_template(template: str, html: bool = False) -> CompiledTemplate:
+    """
+    Parse and compile a template once, for rendering many rows.
+
+    Supported syntax:
+        {field}                        value of a column
+        {field|title}                  filters: title, upper, lower, strip
+        {field|default:Friend}         fallback used when the value is missing
+        {field|raw}                    skip HTML escaping (HTML templates only)
+        {#if field}...{#else}...{/if}  rendered only when field is non-empty
+
+    Args:
+        template: Template source
+        html: If True, field values are HTML-escaped when rendered
+
+    Returns:
+        CompiledTemplate ready to render rows
+
+    Raises:
+        TemplateSyntaxError: If sections are unbalanced or a filter is unknown
+    """
+    placeholders: List[str] = []
+    required: List[str] = []
+    conditions: List[str] = []
+    # Stack of (condition, body, orelse, in_else) for open sections
+    stack: List[Tuple[Optional[str], List[Node], List[Node], bool]] = [(None, [], [], False)]
+
+    def current() -> List[Node]:
+        condition, body, orelse, in_else = stack[-1]
+        return orelse if in_else else body
+
+    position = 0
+    for match in TAG_PATTERN.finditer(template):
+        if match.start() > position:
+            current().append(_compile_text(template[position:match.start()]))
+        position = match.end()
+        tag = match.group(1)
+
+        if tag.startswith('#if'):
+            condition = tag[3:].strip()
+            conditions.append(condition)
+            stack.append((condition, [], [], False))
+        elif tag == '#else':
+            condition, body, orelse, in_else = stack[-1]
+            if condition is None or in_else:
+                raise TemplateSyntaxError("Unexpected {#else} outside of an {#if} section")
+            stack[-1] = (condition, body, orelse, True)
+        elif tag == '/if':
+            if len(stack) == 1:
+                raise TemplateSyntaxError("Unexpected {/if} without a matching {#if}")
+            condition, body, orelse, _ = stack.pop()
+            current().append(_compile_section(condition, body, orelse))
+        else:
+            name, is_required, node = _compile_field(tag, html)
+            placeholders.append(name)
+            if is_required:
+                required.append(name)
+            current().append(node)
+
+    if len(stack) > 1:
+        raise TemplateSyntaxError(f"Unclosed {{#if {stack[-1][0]}}} section")
+    if position < len(template):
+        current().append(_compile_text(template[position:]))
+
+    return CompiledTemplate(
+        source=template,
+        html=html,
+        placeholders=placeholders,
+        required=required,
+        conditions=conditions,
+        _nodes=stack[0][1]
+    )
@@ -1,6 +1,7 @@
 """Template engine for replacing placeholders with row data"""
 import re
 from typing import Dict, List, Tuple
+from .compiler import compile_template
 
 
 def extract_placeholders(template: str) -> List[str]:
@@ -21,14 +22,22 @@ def validate_placeholders(template: str, available_columns: List[str]) -> Tuple[
     """
     Validate that all placeholders in the template exist as columns.
 
+    Uses the compile_template grammar. Placeholders with a default and fields
+    tested by {#if} sections are not reported, since rendering never fails
+    on them.
+
     Args:
         template: Template string with placeholders
         available_columns: List of available column names
 
     Returns:
         Tuple of (is_valid, missing_placeholders)
+
+    Raises:
+        TemplateSyntaxError: If the template cannot be parsed. It subclasses
+            ValueError, so callers already handling ValueError are covered.
     """
-    placeholders = extract_placeholders(template)
+    placeholders = compile_template(template).required
     missing = [p for p in placeholders if p not in available_columns]
     return len(missing) == 0, missing
 
@@ -12,6 +12,7 @@ setup(
         'pandas>=2.1.0',
         'openpyxl>=3.1.0',
         'click>=8.1.0',
+        'httpx[http2]>=0.27.0',
     ],
     entry_points={
         'console_scripts': [